@@ -1,5 +1,18 @@
+import asyncio
+import html
+import json
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import time
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is optional; bulk add falls back to sequential requests
+    aiohttp = None
+
+# Write buffer size for the generated website, which is written one <li> at a time
+_BUFFER_SIZE = 1 << 20
 
 class MovieApp:
     """
@@ -7,6 +20,9 @@ class MovieApp:
     It depends on a storage object that implements the IStorage interface.
     """
 
+    # How long (in seconds) a cached OMDb response stays valid
+    RESPONSE_CACHE_TTL = 7 * 86400
+
     def __init__(self, storage):
         """
         Initialize the MovieApp with a storage object that implements IStorage.
@@ -16,6 +32,33 @@ class MovieApp:
         self._storage = storage
         self._api_key = "3b23248a"   # Replace with your OMDb API key
         self._api_url = "http://www.omdbapi.com/"
+        self._api_params_base = {"apikey": self._api_key}
+
+        # One long-lived session keeps the connection to OMDb alive between requests
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8)
+        self._session.mount("http://", adapter)
+        self._session.mount("https://", adapter)
+
+        # Local cache of OMDb responses so repeated lookups skip the network
+        self._response_cache_path = os.path.join("data", "omdb_cache.json")
+        self._response_cache = self._load_response_cache()
+
+        # (prefix, suffix) of the website template, split on {{MOVIES}} on first use,
+        # and the template's modification time when it was read
+        self._template_parts = None
+        self._template_mtime = None
+
+        # Menu choices mapped to the commands they run
+        self._dispatch = {
+            "1": self._command_list_movies,
+            "2": self._command_add_movie,
+            "3": self._command_delete_movie,
+            "4": self._command_update_movie,
+            "5": self._command_movie_stats,
+            "6": self._command_bulk_add,
+            "9": self._command_generate_website,
+        }
 
     def run(self):
         """
@@ -29,18 +72,10 @@ class MovieApp:
             if command == "0":
                 print("Exiting the app.")
                 break
-            elif command == "1":
-                self._command_list_movies()
-            elif command == "2":
-                self._command_add_movie()
-            elif command == "3":
-                self._command_delete_movie()
-            elif command == "4":
-                self._command_update_movie()
-            elif command == "5":
-                self._command_movie_stats()
-            elif command == "9":
-                self._command_generate_website()
+
+            handler = self._dispatch.get(command)
+            if handler:
+                handler()
             else:
                 print("Invalid choice. Try again.")
 
@@ -55,6 +90,7 @@ class MovieApp:
         print("3. Delete movie")
         print("4. Update movie rating")
         print("5. Show movie stats")
+        print("6. Bulk add movies (fetch data from OMDb)")
         print("9. Generate website")
 
     def _command_list_movies(self):
@@ -68,9 +104,15 @@ class MovieApp:
 
         print("\n--- List of Movies ---")
         for title, info in movies.items():
-            print(f"{title} ({info.get('year', 'N/A')}) - "
-                  f"Rating: {info.get('rating', 'N/A')} - "
-                  f"Poster: {info.get('poster', 'N/A')}")
+            # Read each field once; missing fields are shown as N/A
+            year, rating, poster = info.year, info.rating, info.poster
+            if year is None:
+                year = "N/A"
+            if rating is None:
+                rating = "N/A"
+            if poster is None:
+                poster = "N/A"
+            print(f"{title} ({year}) - Rating: {rating} - Poster: {poster}")
 
     def _command_add_movie(self):
         """
@@ -88,6 +130,34 @@ class MovieApp:
             # If None or empty, an error was already displayed
             return
 
+        self._add_movie_from_data(title, movie_data)
+
+    def _command_bulk_add(self):
+        """
+        Prompts user for a comma-separated list of movie titles, fetches
+        all of them from the OMDb API concurrently and adds every movie
+        that was found to storage.
+        """
+        titles_str = input("Enter movie titles separated by commas: ")
+        titles = [t.strip() for t in titles_str.split(",") if t.strip()]
+        if not titles:
+            print("No titles given. Operation cancelled.")
+            return
+
+        if aiohttp is not None:
+            results = asyncio.run(self._fetch_many(titles))
+        else:
+            results = [self._fetch_movie_data(title) for title in titles]
+
+        for title, movie_data in zip(titles, results):
+            if movie_data:
+                self._add_movie_from_data(title, movie_data)
+
+    def _add_movie_from_data(self, title, movie_data):
+        """
+        Internal helper that parses an OMDb response and adds the movie
+        to storage with Title, Year, Rating, and Poster.
+        """
         # Extract and parse fields (safely)
         try:
             year = int(movie_data.get("Year", "0"))
@@ -157,20 +227,47 @@ class MovieApp:
             print("No movies found. Cannot calculate statistics.")
             return
 
-        ratings = [info["rating"] for info in movies.values() if isinstance(info["rating"], (int, float))]
-        if not ratings:
+        stats = self._rating_stats(movies)
+
+        if stats is None:
             print("No valid ratings found. Cannot calculate statistics.")
             return
 
-        avg_rating = sum(ratings) / len(ratings)
-        max_title = max(movies, key=lambda t: movies[t]["rating"])
-        min_title = min(movies, key=lambda t: movies[t]["rating"])
+        avg_rating, max_title, max_rating, min_title, min_rating = stats
 
         print("\n--- Movie Statistics ---")
         print(f"Number of Movies: {len(movies)}")
         print(f"Average Rating: {avg_rating:.2f}")
-        print(f"Highest Rated: {max_title} ({movies[max_title]['rating']})")
-        print(f"Lowest Rated: {min_title} ({movies[min_title]['rating']})")
+        print(f"Highest Rated: {max_title} ({max_rating})")
+        print(f"Lowest Rated: {min_title} ({min_rating})")
+
+    def _rating_stats(self, movies):
+        """
+        Internal helper computing the average, highest and lowest rating
+        in a single pass over the movies. Non-numeric and NaN ratings are skipped.
+        Returns (avg, max_title, max_rating, min_title, min_rating),
+        or None if no movie has a valid rating.
+        """
+        total = 0.0
+        count = 0
+        max_title, max_rating = None, float("-inf")
+        min_title, min_rating = None, float("inf")
+        for title, info in movies.items():
+            rating = info.rating
+            # Skip missing/non-numeric ratings and NaN (which never equals itself)
+            if not isinstance(rating, (int, float)) or rating != rating:
+                continue
+            total += rating
+            count += 1
+            if rating > max_rating:
+                max_title, max_rating = title, rating
+            if rating < min_rating:
+                min_title, min_rating = title, rating
+
+        if not count:
+            return None
+
+        return total / count, max_title, max_rating, min_title, min_rating
 
     def _command_generate_website(self):
         """
@@ -182,60 +279,207 @@ class MovieApp:
             print("No movies found. Website not generated.")
             return
 
-        # Where is your template located? Adjust as needed.
-        template_path = os.path.join("_static", "index_template.html")
-        if not os.path.exists(template_path):
-            print(f"Template file not found: {template_path}")
+        template_parts = self._load_template_parts()
+        if template_parts is None:
             return
 
-        # Read the template
-        with open(template_path, "r", encoding="utf-8") as f:
-            template_html = f.read()
+        prefix, suffix = template_parts
 
-        # Build the <li> items
-        movie_items_html = ""
-        for title, info in movies.items():
-            poster_url = info.get("poster", "")
-            year = info.get("year", "N/A")
-            movie_items_html += f"""
+        # Stream the result to a temporary file: template prefix, one <li> per movie, suffix.
+        # It replaces index.html only once it is complete, so readers never see a partial page.
+        output_path = "index.html"
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8", buffering=_BUFFER_SIZE) as f:
+            # Bind f.write to a local for the loop
+            write = f.write
+
+            write(prefix)
+            for title, info in movies.items():
+                year = info.year
+                if year is None:
+                    year = "N/A"
+                poster_url = html.escape(str(info.poster or ""))
+                year = html.escape(str(year))
+                safe_title = html.escape(title)
+                write(f"""
             <li>
                 <div class="movie">
                     <img class="movie-poster" src="{poster_url}" alt="Poster">
-                    <div class="movie-title">{title}</div>
+                    <div class="movie-title">{safe_title}</div>
                     <div class="movie-year">{year}</div>
                 </div>
             </li>
-            """
+            """)
+            write(suffix)
 
-        # Insert items into template
-        final_html = template_html.replace("{{MOVIES}}", movie_items_html)
+            f.flush()
+            os.fsync(f.fileno())
 
-        # Save the result to index.html
-        output_path = "index.html"
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(final_html)
+        os.replace(tmp_path, output_path)
 
         print("Website was generated successfully.")
 
+    def _load_template_parts(self):
+        """
+        Internal helper returning the website template as a (prefix, suffix)
+        tuple, split around the {{MOVIES}} placeholder.
+        The template is only read again when its modification time changes.
+        Returns None (after printing an error) if the template is missing.
+        """
+        # Where is your template located? Adjust as needed.
+        template_path = os.path.join("_static", "index_template.html")
+        try:
+            mtime = os.path.getmtime(template_path)
+        except OSError:
+            print(f"Template file not found: {template_path}")
+            return None
+
+        if self._template_parts is None or mtime != self._template_mtime:
+            # Read the template
+            with open(template_path, "r", encoding="utf-8") as f:
+                template_html = f.read()
+
+            prefix, _, suffix = template_html.partition("{{MOVIES}}")
+            self._template_parts = (prefix, suffix)
+            self._template_mtime = mtime
+
+        return self._template_parts
+
+    async def _fetch_many(self, titles):
+        """
+        Internal helper to fetch several movies from OMDb concurrently.
+        All requests share one aiohttp session, so connections are reused.
+        Returns a list with the JSON (dict) or None for every title, in order.
+        """
+        timeout = aiohttp.ClientTimeout(total=5)
+        async with aiohttp.ClientSession(timeout=timeout) as session:
+            results = await asyncio.gather(
+                *(self._fetch_one(session, title) for title in titles)
+            )
+
+        self._save_response_cache()
+        return results
+
+    async def _fetch_one(self, session, title):
+        """
+        Internal helper to fetch a single movie from OMDb with an aiohttp session.
+        Returns the JSON (dict) from OMDb if found, otherwise None.
+        """
+        cached = self._get_cached_response(title)
+        if cached is not None:
+            return cached
+
+        params = {"t": title, **self._api_params_base}
+        try:
+            async with session.get(self._api_url, params=params) as response:
+                if not response.ok:
+                    print(f"Error: OMDb API returned HTTP {response.status} for '{title}'.")
+                    return None
+                data = await response.json(content_type=None)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"Error: Could not connect to OMDb API for '{title}' ({e}).")
+            return None
+        except ValueError:
+            # A body that isn't valid JSON must not abort the whole batch
+            print(f"Error: OMDb API returned an invalid response for '{title}'.")
+            return None
+
+        if data.get("Response") == "False":
+            print(f"Movie not found in OMDb for title '{title}'.")
+            return None
+
+        self._cache_response(title, data)
+        return data
+
     def _fetch_movie_data(self, title):
         """
         Internal helper to fetch movie data from OMDb by title.
         Returns the JSON (dict) from OMDb if found, otherwise None.
         Handles connection errors and 'movie not found' responses gracefully.
+        Responses are served from the local cache when possible.
         """
+        cached = self._get_cached_response(title)
+        if cached is not None:
+            return cached
+
+        params = {"t": title, **self._api_params_base}
         try:
-            params = {"t": title, "apikey": self._api_key}
-            response = requests.get(self._api_url, params=params, timeout=5)
-            response.raise_for_status()  # Raise for 4xx/5xx errors
+            response = self._session.get(self._api_url, params=params, timeout=5)
         except requests.exceptions.RequestException as e:
             print(f"Error: Could not connect to OMDb API ({e}).")
             return None
 
-        data = response.json()
+        # Compare the status code directly: requests' Response.ok calls
+        # raise_for_status() internally and builds an exception on 4xx/5xx
+        if response.status_code >= 400:
+            print(f"Error: OMDb API returned HTTP {response.status_code}.")
+            return None
+
+        try:
+            data = response.json()
+        except ValueError:
+            # A body that isn't valid JSON must not abort a bulk add
+            print(f"Error: OMDb API returned an invalid response for '{title}'.")
+            return None
 
         if data.get("Response") == "False":
             # OMDb returns {"Response": "False", "Error": "..."} if not found
             print(f"Movie not found in OMDb for title '{title}'.")
             return None
 
+        self._cache_response(title, data)
+        self._save_response_cache()
         return data
+
+    def _load_response_cache(self):
+        """
+        Internal helper to load the OMDb response cache from disk.
+        Returns an empty dictionary if the file doesn't exist or is invalid.
+        """
+        if not os.path.exists(self._response_cache_path):
+            return {}
+
+        try:
+            with open(self._response_cache_path, "r", encoding="utf-8") as f:
+                cache = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError, OSError):
+            return {}
+
+        return cache if isinstance(cache, dict) else {}
+
+    def _save_response_cache(self):
+        """
+        Internal helper to write the OMDb response cache to disk.
+        Failing to write the cache is not fatal, so errors are ignored.
+        """
+        try:
+            os.makedirs(os.path.dirname(self._response_cache_path), exist_ok=True)
+            with open(self._response_cache_path, "w", encoding="utf-8") as f:
+                json.dump(self._response_cache, f)
+        except OSError:
+            pass
+
+    def _get_cached_response(self, title):
+        """
+        Internal helper that returns the cached OMDb response for a title,
+        or None if there is none or it is older than RESPONSE_CACHE_TTL.
+        """
+        entry = self._response_cache.get(title.lower().strip())
+        if not isinstance(entry, dict):
+            return None
+
+        # A malformed timestamp is treated as a cache miss
+        ts = entry.get("ts")
+        if not isinstance(ts, (int, float)) or time.time() - ts >= self.RESPONSE_CACHE_TTL:
+            return None
+
+        # Only a dict is a usable OMDb response
+        data = entry.get("data")
+        return data if isinstance(data, dict) else None
+
+    def _cache_response(self, title, data):
+        """
+        Internal helper that stores an OMDb response in the in-memory cache.
+        Call _save_response_cache() to persist it.
+        """
+        self._response_cache[title.lower().strip()] = {"data": data, "ts": time.time()}
@@ -1 +1,4 @@
 # This file can be empty or contain package initialization code if needed.
+
+# Buffer size for storage files read or written in many small pieces (csv rows)
+BUFFER_SIZE = 1 << 20
@@ -0,0 +1,45 @@
+class Movie:
+    """
+    A single movie record as returned by the storages' list_movies().
+
+    The title is the key of the movies dictionary, so it is not stored here.
+    __slots__ keeps every record much smaller than an equivalent dict.
+    """
+
+    __slots__ = ("year", "rating", "poster")
+
+    def __init__(self, year=None, rating=None, poster=None):
+        """
+        :param year: Release year of the movie.
+        :param rating: Rating of the movie (e.g. the IMDb rating).
+        :param poster: URL of the movie poster.
+        """
+        self.year = year
+        self.rating = rating
+        self.poster = poster
+
+    def __repr__(self):
+        return f"Movie(year={self.year!r}, rating={self.rating!r}, poster={self.poster!r})"
+
+    def __eq__(self, other):
+        if not isinstance(other, Movie):
+            return NotImplemented
+        return (self.year, self.rating, self.poster) == (other.year, other.rating, other.poster)
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Create a Movie from a {"year": ..., "rating": ..., "poster": ...} dict,
+        the format the movies are saved in.
+        """
+        return cls(data.get("year"), data.get("rating"), data.get("poster"))
+
+    def to_dict(self):
+        """
+        Return the movie as a {"year": ..., "rating": ..., "poster": ...} dict.
+        """
+        return {
+            "year": self.year,
+            "rating": self.rating,
+            "poster": self.poster
+        }
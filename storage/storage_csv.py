@@ -1,6 +1,15 @@
 import csv
 import os
+from . import BUFFER_SIZE
 from .istorage import IStorage
+from .movie import Movie
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # pyarrow is optional; loading falls back to csv.DictReader
+    pa = None
+    pacsv = None
 
 class StorageCsv(IStorage):
     """
@@ -21,23 +30,21 @@ class StorageCsv(IStorage):
         :param file_path: Path to the CSV file for storing movie data.
         """
         self.file_path = file_path
+        self._cache = None
+        self._dirty = False
 
     def list_movies(self):
         """
-        Reads the CSV file and returns a dictionary of movies.
+        Returns a dictionary mapping titles to Movie records. The CSV file
+        is only read on the first call; later calls are served from the
+        in-memory cache.
 
         Format (as per the IStorage interface):
         {
-          "Titanic": {
-            "year": 1995,
-            "rating": 9.2,
-            "poster": "https://example.com/titanic.jpg"
-          },
-          "The Dark Knight": {
-            "year": 2002,
-            "rating": 8.8,
-            "poster": "https://example.com/darkknight.jpg"
-          }
+          "Titanic": Movie(year=1995, rating=9.2,
+                           poster="https://example.com/titanic.jpg"),
+          "The Dark Knight": Movie(year=2002, rating=8.8,
+                                   poster="https://example.com/darkknight.jpg")
         }
         """
         return self._load_data()
@@ -47,12 +54,9 @@ class StorageCsv(IStorage):
         Adds a new movie entry to the CSV file.
         """
         movies = self._load_data()
-        movies[title] = {
-            "year": year,
-            "rating": rating,
-            "poster": poster
-        }
-        self._save_data(movies)
+        movies[title] = Movie(year, rating, poster)
+        self._dirty = True
+        self._flush()
 
     def delete_movie(self, title):
         """
@@ -61,7 +65,8 @@ class StorageCsv(IStorage):
         movies = self._load_data()
         if title in movies:
             del movies[title]
-        self._save_data(movies)
+            self._dirty = True
+        self._flush()
 
     def update_movie(self, title, rating):
         """
@@ -69,21 +74,74 @@ class StorageCsv(IStorage):
         """
         movies = self._load_data()
         if title in movies:
-            movies[title]["rating"] = rating
-        self._save_data(movies)
+            movies[title].rating = rating
+            self._dirty = True
+        self._flush()
 
     def _load_data(self):
         """
         Internal helper that reads the CSV file and returns a dictionary.
 
         If the file doesn't exist or is empty, returns an empty dictionary.
+        The parsed data is cached, so the file is only read once per instance.
         """
+        if self._cache is not None:
+            return self._cache
+
         if not os.path.exists(self.file_path):
-            return {}
+            self._cache = {}
+            return self._cache
+
+        movies = None
+        if pacsv is not None:
+            movies = self._read_with_arrow()
+        if movies is None:
+            movies = self._read_with_csv()
 
+        self._cache = movies
+        return movies
+
+    def _read_with_arrow(self):
+        """
+        Internal helper that parses the CSV file with pyarrow into typed columns.
+
+        Returns None if pyarrow can't read the file (e.g. a year or rating
+        that isn't a number), so the caller can fall back to _read_with_csv().
+        """
+        convert_options = pacsv.ConvertOptions(
+            column_types={
+                "title": pa.string(),
+                "year": pa.int64(),
+                "rating": pa.float64(),
+                "poster": pa.string()
+            },
+            include_columns=["title", "year", "rating", "poster"]
+        )
+        try:
+            table = pacsv.read_csv(self.file_path, convert_options=convert_options)
+        except (pa.ArrowException, OSError):
+            return None
+
+        # Empty cells become None for year and rating, "" for poster
+        return {
+            title: Movie(year, rating, poster)
+            for title, year, rating, poster in zip(
+                table["title"].to_pylist(),
+                table["year"].to_pylist(),
+                table["rating"].to_pylist(),
+                table["poster"].to_pylist()
+            )
+        }
+
+    def _read_with_csv(self):
+        """
+        Internal helper that parses the CSV file row by row with csv.DictReader.
+        Returns an empty dictionary if the file is corrupted or has missing columns.
+        """
         movies = {}
         try:
-            with open(self.file_path, "r", encoding="utf-8") as csvfile:
+            with open(self.file_path, "r", encoding="utf-8", newline="",
+                      buffering=BUFFER_SIZE) as csvfile:
                 reader = csv.DictReader(csvfile)
                 for row in reader:
                     title = row["title"]
@@ -99,17 +157,22 @@ class StorageCsv(IStorage):
                         rating = None
                     
                     poster = row["poster"]
-                    movies[title] = {
-                        "year": year,
-                        "rating": rating,
-                        "poster": poster
-                    }
-        except (IOError, KeyError, csv.Error):
+                    movies[title] = Movie(year, rating, poster)
+        except (IOError, KeyError, csv.Error, UnicodeDecodeError):
             # Return empty if file is corrupted or has missing columns
             return {}
-        
+
         return movies
 
+    def _flush(self):
+        """
+        Internal helper that writes the cached movies back to the CSV file,
+        but only if they were modified since the last write.
+        """
+        if self._dirty:
+            self._save_data(self._cache)
+            self._dirty = False
+
     def _save_data(self, movies):
         """
         Internal helper that writes the dictionary back to the CSV file.
@@ -118,15 +181,16 @@ class StorageCsv(IStorage):
         # Convert dictionary to a list of rows that DictWriter can handle
         fieldnames = ["title", "year", "rating", "poster"]
         
-        with open(self.file_path, "w", encoding="utf-8", newline="") as csvfile:
+        with open(self.file_path, "w", encoding="utf-8", newline="",
+                  buffering=BUFFER_SIZE) as csvfile:
             writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
             writer.writeheader()
-            for title, info in movies.items():
-                # info is a dict like {"year": 1995, "rating": 9.2, "poster": "..."}
+            for title, movie in movies.items():
+                # None fields are written as empty cells
                 row = {
                     "title": title,
-                    "year": info.get("year", ""),
-                    "rating": info.get("rating", ""),
-                    "poster": info.get("poster", "")
+                    "year": movie.year,
+                    "rating": movie.rating,
+                    "poster": movie.poster
                 }
                 writer.writerow(row)
@@ -1,71 +1,214 @@
 import json
 import os
 from .istorage import IStorage
+from .movie import Movie
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib parser
+    orjson = None
+
+# Errors raised when the file content is not valid JSON
+_DECODE_ERRORS = (json.JSONDecodeError, UnicodeDecodeError)
+if orjson is not None:
+    _DECODE_ERRORS += (orjson.JSONDecodeError,)
+
+
+def _loads(raw):
+    """
+    Parse JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode('utf-8'))
+
+
+def _dumps(data, indent=True):
+    """
+    Serialize data to JSON bytes, using orjson when it is installed.
+    Pass indent=False for compact single-line output.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if indent else 0)
+    # Match orjson's output (2-space indent, raw UTF-8), so the file
+    # format doesn't depend on which optional packages are installed
+    if indent:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
 class StorageJson(IStorage):
+    """
+    A concrete implementation of the IStorage interface that
+    stores movie data in a JSON file.
+
+    Mutations are not written by rewriting the whole JSON file.
+    Instead every change is appended as one line to a write-ahead log
+    next to it (e.g. data/movies.log), which is replayed on top of the
+    JSON snapshot when loading. Mutations therefore never need to parse
+    the JSON file themselves. Once the log grows past
+    LOG_COMPACT_SIZE bytes, the snapshot is rewritten and the log is
+    truncated.
+    """
+
+    # Log size in bytes after which the log is merged into the snapshot
+    LOG_COMPACT_SIZE = 1 << 20
 
     def __init__(self, file_path):
         """
         :param file_path: Path to the JSON file where movie data is stored.
         """
         self.file_path = file_path
+        self._cache = None
 
     def list_movies(self):
         """
-        Load and return the entire dictionary of movies from the JSON file.
+        Return the entire dictionary of movies, mapping titles to Movie records.
+        The JSON file is only read on the first call; later calls are served
+        from the in-memory cache.
         If the file doesn't exist or is invalid, return an empty dict.
         """
-        movies = self._load_data()
-        return movies
+        return self._load_data()
 
     def add_movie(self, title, year, rating, poster):
         """
         Add a new movie to the JSON file.
+        When the movies haven't been loaded yet, only the log is written.
         """
-        movies = self._load_data()
-        movies[title] = {
-            "year": year,
-            "rating": rating,
-            "poster": poster
-        }
-        self._save_data(movies)
+        if self._cache is not None:
+            self._cache[title] = Movie(year, rating, poster)
+        self._append_log({"op": "add", "title": title, "year": year,
+                          "rating": rating, "poster": poster})
 
     def delete_movie(self, title):
         """
         Delete a movie by its title key.
+        When the movies haven't been loaded yet, only the log is written.
         """
-        movies = self._load_data()
-        if title in movies:
-            del movies[title]
-        self._save_data(movies)
+        if self._cache is not None:
+            if title not in self._cache:
+                return
+            del self._cache[title]
+        self._append_log({"op": "delete", "title": title})
 
     def update_movie(self, title, rating):
         """
         Update the rating of an existing movie.
+        When the movies haven't been loaded yet, only the log is written;
+        replaying it ignores updates of movies that don't exist.
         """
-        movies = self._load_data()
-        if title in movies:
-            movies[title]["rating"] = rating
-        self._save_data(movies)
+        if self._cache is not None:
+            if title not in self._cache:
+                return
+            self._cache[title].rating = rating
+        self._append_log({"op": "update", "title": title, "rating": rating})
 
     def _load_data(self):
         """
-        Internal helper method to load movie data from the JSON file.
+        Internal helper method to load movie data from the JSON file
+        and replay the write-ahead log on top of it.
         Returns an empty dictionary if the file doesn't exist or the JSON is invalid.
+        The parsed data is cached, so the files are only read once per instance.
         """
+        if self._cache is not None:
+            return self._cache
+
         # Load the file from the data directory
         file_path = os.path.join('data', os.path.basename(self.file_path))
-        
-        if not os.path.exists(file_path):
-            return {}
+
+        movies = {}
+        if os.path.exists(file_path):
+            try:
+                # Read the file in one bulk read and parse it once
+                with open(file_path, 'rb') as f:
+                    raw = _loads(f.read())
+                movies = {title: Movie.from_dict(info) for title, info in raw.items()}
+            except _DECODE_ERRORS + (OSError, AttributeError):
+                movies = {}
+
+        self._cache = movies
+        self._replay_log(movies)
+        return self._cache
+
+    def _log_path(self):
+        """
+        Internal helper returning the path of the write-ahead log.
+        """
+        base_name = os.path.splitext(os.path.basename(self.file_path))[0]
+        return os.path.join('data', base_name + '.log')
+
+    def _append_log(self, record):
+        """
+        Internal helper that appends a single mutation record to the log,
+        compacting the log into the JSON file once it gets too large.
+        A record cut off by an earlier crash is terminated first, so the
+        new record always gets a line of its own.
+        """
+        os.makedirs('data', exist_ok=True)
+
+        line = _dumps(record, indent=False) + b'\n'
+
+        log_path = self._log_path()
+        with open(log_path, 'ab+') as f:
+            # Mutations may run without loading (and so without _replay_log
+            # cleaning up), so start on a fresh line if a crash left the
+            # last record cut off
+            size = f.seek(0, os.SEEK_END)
+            if size:
+                f.seek(size - 1)
+                if f.read(1) != b'\n':
+                    line = b'\n' + line
+            # Writes in append mode always go to the end of the file
+            f.write(line)
+            size = f.tell()
+
+        if size > self.LOG_COMPACT_SIZE:
+            self._compact()
+
+    def _replay_log(self, movies):
+        """
+        Internal helper that applies every record of the log to movies.
+        Lines that can't be parsed are skipped, and a last line cut off by a
+        crash is removed from the log.
+        """
+        log_path = self._log_path()
+        if not os.path.exists(log_path):
+            return
 
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, OSError):
-            return {}
+            with open(log_path, 'rb+') as f:
+                raw = f.read()
+                if raw and not raw.endswith(b'\n'):
+                    # Drop a partially written last record; it can never be parsed
+                    raw = raw[:raw.rfind(b'\n') + 1]
+                    f.truncate(len(raw))
+        except OSError:
+            return
 
-    def _save_data(self, data):
+        for line in raw.splitlines():
+            try:
+                record = _loads(line)
+                op = record["op"]
+                title = record["title"]
+                if op == "add":
+                    movies[title] = Movie(record["year"], record["rating"], record["poster"])
+                elif op == "delete":
+                    movies.pop(title, None)
+                elif op == "update" and title in movies:
+                    movies[title].rating = record["rating"]
+            except _DECODE_ERRORS + (KeyError, TypeError):
+                continue
+
+    def _compact(self):
+        """
+        Internal helper that writes the merged movies back to the JSON file
+        and truncates the log. The log is only truncated after the new
+        snapshot has been safely replaced.
+        """
+        self._save_data(self._load_data())
+        with open(self._log_path(), 'wb'):
+            pass
+
+    def _save_data(self, movies):
         """
         Internal helper method to save the dictionary of movies back to the JSON file.
         """
@@ -74,5 +217,14 @@ class StorageJson(IStorage):
         
         # Save the file in the data directory
         file_path = os.path.join('data', os.path.basename(self.file_path))
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=4)
+        # Serialize up front so the file is written in a single call
+        payload = _dumps({title: movie.to_dict() for title, movie in movies.items()})
+
+        # Write to a temporary file and move it into place only once it is
+        # complete, so a crash mid-write never leaves a corrupt snapshot
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
@@ -0,0 +1,134 @@
+import os
+import msgpack
+from .istorage import IStorage
+from .movie import Movie
+from .storage_json import StorageJson
+
+class StorageMsgpack(IStorage):
+    """
+    A concrete implementation of the IStorage interface that
+    stores movie data in a MessagePack file.
+
+    MessagePack is a binary format: files are smaller than the JSON
+    equivalent and faster to (de)serialize. The data layout is the same
+    {title: {"year": ..., "rating": ..., "poster": ...}} dictionary that
+    StorageJson saves.
+    """
+
+    def __init__(self, file_path):
+        """
+        :param file_path: Path to the MessagePack file where movie data is stored.
+        """
+        self.file_path = file_path
+        self._cache = None
+        self._dirty = False
+
+    def list_movies(self):
+        """
+        Return the entire dictionary of movies, mapping titles to Movie records.
+        The file is only read on the first call; later calls are served
+        from the in-memory cache.
+        If the file doesn't exist or is invalid, return an empty dict.
+        """
+        return self._load_data()
+
+    def add_movie(self, title, year, rating, poster):
+        """
+        Add a new movie to the MessagePack file.
+        """
+        movies = self._load_data()
+        movies[title] = Movie(year, rating, poster)
+        self._dirty = True
+        self._flush()
+
+    def delete_movie(self, title):
+        """
+        Delete a movie by its title key.
+        """
+        movies = self._load_data()
+        if title in movies:
+            del movies[title]
+            self._dirty = True
+        self._flush()
+
+    def update_movie(self, title, rating):
+        """
+        Update the rating of an existing movie.
+        """
+        movies = self._load_data()
+        if title in movies:
+            movies[title].rating = rating
+            self._dirty = True
+        self._flush()
+
+    def _load_data(self):
+        """
+        Internal helper method to load movie data from the MessagePack file.
+        Returns an empty dictionary if the file doesn't exist or is invalid.
+        The parsed data is cached, so the file is only read once per instance.
+        """
+        if self._cache is not None:
+            return self._cache
+
+        # Load the file from the data directory
+        file_path = os.path.join('data', os.path.basename(self.file_path))
+
+        if not os.path.exists(file_path):
+            self._cache = {}
+            return self._cache
+
+        try:
+            with open(file_path, 'rb') as f:
+                raw = msgpack.unpackb(f.read(), raw=False)
+            movies = {title: Movie.from_dict(info) for title, info in raw.items()}
+        except (ValueError, msgpack.UnpackException, OSError, AttributeError):
+            movies = {}
+
+        self._cache = movies
+        return self._cache
+
+    def _flush(self):
+        """
+        Internal helper that writes the cached movies back to the file,
+        but only if they were modified since the last write.
+        """
+        if self._dirty:
+            self._save_data(self._cache)
+            self._dirty = False
+
+    def _save_data(self, movies):
+        """
+        Internal helper method to save the dictionary of movies back to the MessagePack file.
+        """
+        # Ensure the data directory exists
+        os.makedirs('data', exist_ok=True)
+
+        # Save the file in the data directory
+        file_path = os.path.join('data', os.path.basename(self.file_path))
+        data = {title: movie.to_dict() for title, movie in movies.items()}
+        payload = msgpack.packb(data, use_bin_type=True)
+
+        # Write to a temporary file and move it into place only once it is
+        # complete, so a crash mid-write never leaves a corrupt file
+        tmp_path = file_path + '.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, file_path)
+
+
+def migrate_from_json(json_path, msgpack_path):
+    """
+    One-shot helper that copies every movie from a JSON storage file
+    into a MessagePack storage file, e.g.:
+
+        migrate_from_json("movies.json", "movies.msgpack")
+
+    Returns the StorageMsgpack instance holding the migrated data.
+    """
+    storage = StorageMsgpack(msgpack_path)
+    storage._cache = dict(StorageJson(json_path).list_movies())
+    storage._dirty = True
+    storage._flush()
+    return storage
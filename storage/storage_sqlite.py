@@ -0,0 +1,71 @@
+import os
+import sqlite3
+from .istorage import IStorage
+from .movie import Movie
+
+class StorageSqlite(IStorage):
+    """
+    A concrete implementation of the IStorage interface that
+    stores movie data in a SQLite database.
+
+    Every movie is a row of the 'movies' table:
+        title TEXT PRIMARY KEY, year INTEGER, rating REAL, poster TEXT
+
+    Adding, deleting and updating a movie touches a single row instead
+    of rewriting the whole file.
+    """
+
+    def __init__(self, file_path):
+        """
+        :param file_path: Path to the SQLite database file where movie data is stored.
+        """
+        self.file_path = file_path
+
+        # Ensure the data directory exists
+        os.makedirs('data', exist_ok=True)
+
+        # Keep the database in the data directory
+        db_path = os.path.join('data', os.path.basename(self.file_path))
+
+        # Autocommit: every statement is its own transaction
+        self._conn = sqlite3.connect(db_path, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS movies ("
+            "title TEXT PRIMARY KEY, year INTEGER, rating REAL, poster TEXT)"
+        )
+
+    def list_movies(self):
+        """
+        Return the entire dictionary of movies, mapping titles to Movie records.
+        """
+        rows = self._conn.execute("SELECT title, year, rating, poster FROM movies")
+        return {title: Movie(year, rating, poster) for title, year, rating, poster in rows}
+
+    def add_movie(self, title, year, rating, poster):
+        """
+        Add a new movie to the database, replacing a movie with the same title.
+        """
+        self._conn.execute(
+            "INSERT OR REPLACE INTO movies (title, year, rating, poster) VALUES (?, ?, ?, ?)",
+            (title, year, rating, poster)
+        )
+
+    def delete_movie(self, title):
+        """
+        Delete a movie by its title.
+        """
+        self._conn.execute("DELETE FROM movies WHERE title = ?", (title,))
+
+    def update_movie(self, title, rating):
+        """
+        Update the rating of an existing movie.
+        """
+        self._conn.execute("UPDATE movies SET rating = ? WHERE title = ?", (rating, title))
+
+    def close(self):
+        """
+        Close the database connection.
+        """
+        self._conn.close()